@@ -9,12 +9,20 @@ Diego Margoni
 from __future__ import annotations
 
 import abc
+import copy
+import dataclasses
+import hashlib
+import logging
+import pickle
 import typing
+from pathlib import Path
 
+import numpy as np
 from pydantic import BaseModel
 
 from pyoma2.algorithms.data.result import BaseResult
 from pyoma2.algorithms.data.run_params import BaseRunParams
+from pyoma2.functions.gen import load_from_file, save_to_file
 
 if typing.TYPE_CHECKING:
     pass
@@ -24,6 +32,35 @@ T_RunParams = typing.TypeVar("T_RunParams", bound=BaseRunParams)
 T_Result = typing.TypeVar("T_Result", bound=BaseResult)
 T_Data = typing.TypeVar("T_Data", bound=typing.Iterable)
 
+logger = logging.getLogger(__name__)
+
+RESULT_CACHE_DEFAULT_DIR: Path = Path("./.pyoma2_cache/")
+
+
+def _hash_update(h: "hashlib._Hash", obj: typing.Any) -> None:
+    """
+    Update the hash `h` with the contents of `obj`, walking through dictionaries, lists
+    and tuples (as the multi-setup data) and hashing the buffers of numpy arrays.
+    """
+    if isinstance(obj, np.ndarray):
+        # the memory order is part of the header: the same buffer read in C or in
+        # Fortran order holds different values
+        order = "F" if obj.flags.f_contiguous else "C"
+        h.update(repr((obj.shape, obj.dtype.str, order)).encode())
+        # channel-major data (see `_set_data`) are hashed through their C-ordered view
+        arr = obj.T if order == "F" else obj
+        h.update(np.ascontiguousarray(arr).data)
+    elif isinstance(obj, dict):
+        for key in sorted(obj, key=repr):
+            h.update(repr(key).encode())
+            _hash_update(h, obj[key])
+    elif isinstance(obj, (list, tuple)):
+        h.update(f"{type(obj).__name__}{len(obj)}".encode())
+        for item in obj:
+            _hash_update(h, item)
+    else:
+        h.update(repr(obj).encode())
+
 
 class BaseAlgorithm(typing.Generic[T_RunParams, T_Result, T_Data], abc.ABC):
     """
@@ -42,7 +79,8 @@ class BaseAlgorithm(typing.Generic[T_RunParams, T_Result, T_Data], abc.ABC):
     name : Optional[str]
         The name of the algorithm, used for identification and logging.
     RunParamCls : Type[T_RunParams]
-        The class used for instantiating run parameters. Must be a subclass of BaseModel.
+        The class used for instantiating run parameters. Must be a subclass of BaseModel
+        or a dataclass.
     ResultCls : Type[T_Result]
         The class used for encapsulating the algorithm's results. Must be a subclass
         of BaseResult.
@@ -57,6 +95,8 @@ class BaseAlgorithm(typing.Generic[T_RunParams, T_Result, T_Data], abc.ABC):
     -------
     __init__(self, run_params=None, name=None, *args, **kwargs)
         Initializes the algorithm with optional run parameters and a name.
+    run_cached(self, cache_dir)
+        Executes the algorithm, reusing the result saved on disk by a previous run.
     set_run_params(self, run_params)
         Sets the run parameters for the algorithm.
     _set_result(self, result)
@@ -64,7 +104,7 @@ class BaseAlgorithm(typing.Generic[T_RunParams, T_Result, T_Data], abc.ABC):
     _set_data(self, data, fs)
         Sets the input data and sampling frequency for the algorithm.
     __class_getitem__(cls, item)
-        Evaluates the types of `RunParamCls` and `ResultCls` at runtime.
+        Returns the class itself, type parameters are only used for type checking.
     __init_subclass__(cls, **kwargs)
         Ensures that subclasses define `RunParamCls` and `ResultCls`.
 
@@ -163,6 +203,61 @@ class BaseAlgorithm(typing.Generic[T_RunParams, T_Result, T_Data], abc.ABC):
         output is an instance of the `ResultCls`.
         """
 
+    def run_cached(
+        self, cache_dir: typing.Union[str, Path] = RESULT_CACHE_DEFAULT_DIR
+    ) -> T_Result:
+        """
+        Execute the algorithm, reusing the result saved on disk by a previous run with
+        the same data, sampling frequency and run parameters.
+
+        The result is stored in `cache_dir`, in a file named after the algorithm class
+        and a SHA-256 hash of the algorithm class, data, sampling frequency and run
+        parameters. If the file does not exist the algorithm is run and its result saved.
+        The parameters used only by ``mpe`` (``MPE_FIELDS`` of the run parameters class)
+        are not part of the hash, so the cached result is reused after calling ``mpe``.
+
+        Parameters
+        ----------
+        cache_dir : str or Path, optional
+            Directory where the results are saved. Default is "./.pyoma2_cache/".
+
+        Returns
+        -------
+        T_Result
+            The result of the algorithm execution, also set as the `result` attribute.
+
+        Note
+        -----
+        The results are saved with pickle: only load cache directories you trust. The
+        cache is not invalidated when pyOMA2 itself changes, delete the directory to
+        force the algorithms to run again.
+        """
+        self._pre_run()
+        if isinstance(self.run_params, BaseModel):
+            run_params = self.run_params.model_dump()
+        else:
+            run_params = dataclasses.asdict(self.run_params)
+        mpe_fields = getattr(self.run_params, "MPE_FIELDS", frozenset())
+        run_params = {k: v for k, v in run_params.items() if k not in mpe_fields}
+
+        h = hashlib.sha256()
+        _hash_update(h, f"{self.__class__.__module__}.{self.__class__.__qualname__}")
+        _hash_update(h, self.fs)
+        _hash_update(h, self.data)
+        h.update(pickle.dumps(run_params))
+        cache_file = Path(cache_dir) / f"{self.__class__.__name__}_{h.hexdigest()}.pkl"
+
+        if cache_file.exists():
+            logger.info("%s: loading result from %s", self.name, cache_file)
+            result = load_from_file(str(cache_file))
+        else:
+            result = self.run()
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            save_to_file(result, str(cache_file))
+            logger.debug("%s: result saved to %s", self.name, cache_file)
+        self._set_result(result)
+        return result
+
     def set_run_params(self, run_params: T_RunParams) -> "BaseAlgorithm":
         """
         Set the run parameters for the algorithm.
@@ -293,40 +388,70 @@ class BaseAlgorithm(typing.Generic[T_RunParams, T_Result, T_Data], abc.ABC):
         -----
         This method is typically used by the Setup class to provide the necessary data and sampling
         frequency to the algorithm before its execution.
+        Array data, given with shape (ndat, nch), is stored in column-major (Fortran)
+        order, so that the transpose `data.T` used by the algorithms is a C-contiguous
+        (nch, ndat) array with each channel contiguous in memory. No copy is made if
+        the data are already float Fortran-ordered arrays.
         """
+        if isinstance(data, np.ndarray):
+            data = np.asfortranarray(data, dtype=float)
         self.data = data
         self.fs = fs
         self.dt = 1 / fs
         return self
 
+    def __copy__(self) -> "BaseAlgorithm":
+        """
+        Return a shallow copy of the algorithm with its own run parameters.
+
+        The run parameters are copied with `model_copy` (or `copy.copy` for dataclass
+        run parameters), i.e. without being validated again, so that an already
+        configured algorithm can be used as a template for several setups without
+        paying the validation cost each time. A separate copy is needed because the
+        `mpe` methods update the run parameters in place.
+
+        Returns
+        -------
+        BaseAlgorithm
+            The copied algorithm instance.
+
+        Note
+        -----
+        The data, sampling frequency and result are shared with the original instance,
+        they are replaced as soon as the copy is added to a Setup and run.
+        """
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        if isinstance(self.run_params, BaseModel):
+            new.run_params = self.run_params.model_copy()
+        elif self.run_params is not None:
+            new.run_params = copy.copy(self.run_params)
+        return new
+
     def __class_getitem__(cls, item):
         """
-        Class method to evaluate the types of `RunParamCls` and `ResultCls` at runtime.
+        Class method handling the subscription of the generic algorithm classes.
 
-        This method dynamically sets the `RunParamCls` and `ResultCls` class attributes based on the
-        provided `item` types.
+        The type parameters (`RunParamCls`, `ResultCls` and data type) are only used
+        for static type checking: the subscription returns the class itself, so that
+        e.g. ``FDD[EFDDRunParams, EFDDResult, ...]`` is ``FDD``, without creating new
+        classes or mutating the subscripted one.
 
         Parameters
         ----------
         item : tuple
-            A tuple containing the types for `RunParamCls` and `ResultCls`.
+            A tuple containing the types for `RunParamCls`, `ResultCls` and data.
 
         Returns
         -------
         cls : BaseAlgorithm
-            The class with evaluated `RunParamCls` and `ResultCls`.
+            The subscripted class, unchanged.
 
         Note
         -----
-        This class method is a workaround to dynamically determine the types of `RunParamCls` and `ResultCls`
-        at runtime. It is particularly useful for type checking and ensuring consistency across different
-        subclasses of `BaseAlgorithm`.
+        `RunParamCls` and `ResultCls` must be set as class attributes in the subclasses,
+        this is checked in `__init_subclass__`.
         """
-        # tricky way to evaluate at runtime the type of the RunParamCls and ResultCls
-        if not issubclass(cls, BaseAlgorithm):
-            # avoid evaluating the types for the BaseAlgorithm class itself
-            cls.RunParamCls = item[0]
-            cls.ResultCls = item[1]
         return cls
 
     def __init_subclass__(cls, **kwargs):
@@ -338,8 +463,8 @@ class BaseAlgorithm(typing.Generic[T_RunParams, T_Result, T_Data], abc.ABC):
         Raises
         ------
         ValueError
-            If `RunParamCls` or `ResultCls` are not defined or not subclasses of `BaseModel` and `BaseResult`,
-            respectively.
+            If `RunParamCls` or `ResultCls` are not defined or not subclasses of `BaseModel`
+            (or dataclasses) and `BaseResult`, respectively.
 
         Note
         -----
@@ -349,8 +474,10 @@ class BaseAlgorithm(typing.Generic[T_RunParams, T_Result, T_Data], abc.ABC):
         """
         super().__init_subclass__(**kwargs)
 
-        if not getattr(cls, "RunParamCls", None) or not issubclass(
-            cls.RunParamCls, BaseModel
+        run_param_cls = getattr(cls, "RunParamCls", None)
+        if not isinstance(run_param_cls, type) or not (
+            issubclass(run_param_cls, BaseModel)
+            or dataclasses.is_dataclass(run_param_cls)
         ):
             raise ValueError(
                 f"{cls.__name__}: RunParamCls must be defined in subclasses of BaseAlgorithm\n\n"
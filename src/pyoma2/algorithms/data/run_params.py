@@ -15,10 +15,19 @@ from pydantic import BaseModel, ConfigDict
 class BaseRunParams(BaseModel):
     """
     Base class for storing run parameters for modal analysis algorithms.
+
+    Attributes
+    ----------
+    MPE_FIELDS : frozenset of str
+        Names of the parameters used only by the ``mpe`` and ``mpe_from_plot``
+        methods. They do not affect the result of ``run`` and are left out of the key
+        of ``BaseAlgorithm.run_cached``.
     """
 
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True)
 
+    MPE_FIELDS: typing.ClassVar[typing.FrozenSet[str]] = frozenset()
+
 
 class FDDRunParams(BaseRunParams):
     """
@@ -32,6 +41,9 @@ class FDDRunParams(BaseRunParams):
         Method used for spectral density estimation, default is "per".
     pov : float, optional
         Percentage of overlap between segments (only for "per"), default is 0.5.
+    dtype : str, optional ["complex128", "complex64"]
+        Data type of the spectral density matrix and of its singular values/vectors,
+        "complex64" halves their memory, default is "complex128".
     sel_freq : numpy.ndarray
         Array of selected frequencies for modal parameter estimation,.
     DF : float, optional
@@ -46,10 +58,13 @@ class FDDRunParams(BaseRunParams):
     nxseg: int = 1024
     method_SD: typing.Literal["per", "cor"] = "per"
     pov: float = 0.5
+    dtype: typing.Literal["complex128", "complex64"] = "complex128"
     # METODO 2: mpe e mpe_from_plot
     sel_freq: typing.Optional[npt.NDArray[np.float64]] = None
     DF: float = 0.1
 
+    MPE_FIELDS: typing.ClassVar[typing.FrozenSet[str]] = frozenset(("sel_freq", "DF"))
+
 
 class EFDDRunParams(BaseRunParams):
     """
@@ -63,6 +78,9 @@ class EFDDRunParams(BaseRunParams):
         Method used for spectral density estimation, default is "per".
     pov : float, optional
         Percentage of overlap between segments (only for "per"), default is 0.5.
+    dtype : str, optional ["complex128", "complex64"]
+        Data type of the spectral density matrix and of its singular values/vectors,
+        "complex64" halves their memory, default is "complex128".
     sel_freq : numpy.ndarray
         Array of selected frequencies for modal parameter estimation,.
     DF1 : float, optional
@@ -87,6 +105,7 @@ class EFDDRunParams(BaseRunParams):
     nxseg: int = 1024
     method_SD: typing.Literal["per", "cor"] = "per"
     pov: float = 0.5
+    dtype: typing.Literal["complex128", "complex64"] = "complex128"
     # METODO 2: mpe e mpe_from_plot
     sel_freq: typing.Optional[npt.NDArray[np.float64]] = None
     DF1: float = 0.1
@@ -96,6 +115,10 @@ class EFDDRunParams(BaseRunParams):
     sppk: int = 3
     npmax: int = 20
 
+    MPE_FIELDS: typing.ClassVar[typing.FrozenSet[str]] = frozenset(
+        ("sel_freq", "DF1", "DF2", "cm", "MAClim", "sppk", "npmax")
+    )
+
 
 class SSIRunParams(BaseRunParams):
     """
@@ -165,6 +188,10 @@ class SSIRunParams(BaseRunParams):
     order_in: typing.Union[int, list, str] = "find_min"
     rtol: float = 5e-2
 
+    MPE_FIELDS: typing.ClassVar[typing.FrozenSet[str]] = frozenset(
+        ("sel_freq", "order_in", "rtol")
+    )
+
 
 class pLSCFRunParams(BaseRunParams):
     """
@@ -227,3 +254,7 @@ class pLSCFRunParams(BaseRunParams):
     sel_freq: typing.Optional[typing.List[float]] = None
     order_in: typing.Union[int, str] = "find_min"
     rtol: float = 5e-2
+
+    MPE_FIELDS: typing.ClassVar[typing.FrozenSet[str]] = frozenset(
+        ("sel_freq", "order_in", "rtol")
+    )
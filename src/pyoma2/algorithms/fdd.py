@@ -11,11 +11,13 @@ from __future__ import annotations
 import logging
 import typing
 
+import numpy as np
+import numpy.typing as npt
+
 from pyoma2.algorithms.base import BaseAlgorithm
 from pyoma2.algorithms.data.result import EFDDResult, FDDResult
 from pyoma2.algorithms.data.run_params import EFDDRunParams, FDDRunParams
-from pyoma2.functions import fdd, plot
-from pyoma2.support.sel_from_plot import SelFromPlot
+from pyoma2.functions import fdd
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +26,7 @@ logger = logging.getLogger(__name__)
 # SINGLE SETUP
 # =============================================================================
 # FREQUENCY DOMAIN DECOMPOSITION
-class FDD(BaseAlgorithm[FDDRunParams, FDDResult, typing.Iterable[float]]):
+class FDD(BaseAlgorithm[FDDRunParams, FDDResult, npt.NDArray[np.float64]]):
     """
     Frequency Domain Decomposition (FDD) algorithm for operational modal analysis.
 
@@ -38,8 +40,9 @@ class FDD(BaseAlgorithm[FDDRunParams, FDDResult, typing.Iterable[float]]):
         Class of the run parameters specific to the FDD algorithm.
     ResultCls : Type[FDDResult]
         Class of the results generated by the FDD algorithm.
-    data : Iterable[float]
-        Input data for the algorithm, typically a time series of vibration measurements.
+    data : ndarray
+        Input data for the algorithm, time series of vibration measurements with shape
+        (ndat, nch).
     """
 
     RunParamCls = FDDRunParams
@@ -62,9 +65,10 @@ class FDD(BaseAlgorithm[FDDRunParams, FDDResult, typing.Iterable[float]]):
         nxseg = self.run_params.nxseg
         method = self.run_params.method_SD
         pov = self.run_params.pov
+        dtype = self.run_params.dtype
         # self.run_params.df = 1 / dt / nxseg
 
-        freq, Sy = fdd.SD_est(Y, Y, self.dt, nxseg, method=method, pov=pov)
+        freq, Sy = fdd.SD_est(Y, Y, self.dt, nxseg, method=method, pov=pov, dtype=dtype)
         Sval, Svec = fdd.SD_svalsvec(Sy)
 
         # Return results
@@ -134,6 +138,8 @@ class FDD(BaseAlgorithm[FDDRunParams, FDDResult, typing.Iterable[float]]):
         None
             Updates the results in the associated FDDResult object with the selected modal parameters.
         """
+        from pyoma2.support.sel_from_plot import SelFromPlot
+
         super().mpe_from_plot(freqlim=freqlim)
 
         # Sy = self.result.Sy
@@ -184,6 +190,8 @@ class FDD(BaseAlgorithm[FDDRunParams, FDDResult, typing.Iterable[float]]):
         ValueError
             If the algorithm has not been run and no results are available.
         """
+        from pyoma2.functions import plot
+
         if not self.result:
             raise ValueError("Run algorithm first")
         fig, ax = plot.CMIF_plot(
@@ -194,7 +202,7 @@ class FDD(BaseAlgorithm[FDDRunParams, FDDResult, typing.Iterable[float]]):
 
 # ------------------------------------------------------------------------------
 # ENHANCED FREQUENCY DOMAIN DECOMPOSITION EFDD
-class EFDD(FDD[EFDDRunParams, EFDDResult, typing.Iterable[float]]):
+class EFDD(FDD[EFDDRunParams, EFDDResult, npt.NDArray[np.float64]]):
     """
     Enhanced Frequency Domain Decomposition (EFDD) Algorithm Class.
 
@@ -329,6 +337,7 @@ class EFDD(FDD[EFDDRunParams, EFDDResult, typing.Iterable[float]]):
         None
             Updates the EFDDResult object with modal parameters selected from the plot.
         """
+        from pyoma2.support.sel_from_plot import SelFromPlot
 
         # Save run parameters
         self.run_params.DF1 = DF1
@@ -388,6 +397,7 @@ class EFDD(FDD[EFDDRunParams, EFDDResult, typing.Iterable[float]]):
         ValueError
             If the algorithm has not been run and no results are available.
         """
+        from pyoma2.functions import plot
 
         if not self.result:
             raise ValueError("Run algorithm first")
@@ -482,9 +492,12 @@ class FDD_MS(FDD[FDDRunParams, FDDResult, typing.Iterable[dict]]):
         nxseg = self.run_params.nxseg
         method = self.run_params.method_SD
         pov = self.run_params.pov
+        dtype = self.run_params.dtype
         # self.run_params.df = 1 / dt / nxseg
 
-        freq, Sy = fdd.SD_PreGER(Y, self.fs, nxseg=nxseg, method=method, pov=pov)
+        freq, Sy = fdd.SD_PreGER(
+            Y, self.fs, nxseg=nxseg, method=method, pov=pov, dtype=dtype
+        )
         Sval, Svec = fdd.SD_svalsvec(Sy)
 
         # Return results
@@ -543,9 +556,12 @@ class EFDD_MS(EFDD[EFDDRunParams, EFDDResult, typing.Iterable[dict]]):
         nxseg = self.run_params.nxseg
         method = self.run_params.method_SD
         pov = self.run_params.pov
+        dtype = self.run_params.dtype
         # self.run_params.df = 1 / dt / nxseg
 
-        freq, Sy = fdd.SD_PreGER(Y, self.fs, nxseg=nxseg, method=method, pov=pov)
+        freq, Sy = fdd.SD_PreGER(
+            Y, self.fs, nxseg=nxseg, method=method, pov=pov, dtype=dtype
+        )
         Sval, Svec = fdd.SD_svalsvec(Sy)
 
         # Return results
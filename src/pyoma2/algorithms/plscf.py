@@ -11,10 +11,12 @@ from __future__ import annotations
 import logging
 import typing
 
+import numpy as np
+import numpy.typing as npt
+
 from pyoma2.algorithms.data.result import pLSCFResult
 from pyoma2.algorithms.data.run_params import pLSCFRunParams
-from pyoma2.functions import fdd, gen, plot, plscf
-from pyoma2.support.sel_from_plot import SelFromPlot
+from pyoma2.functions import fdd, gen, plscf
 
 from .base import BaseAlgorithm
 
@@ -24,7 +26,7 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 # SINGLE SETUP
 # =============================================================================
-class pLSCF(BaseAlgorithm[pLSCFRunParams, pLSCFResult, typing.Iterable[float]]):
+class pLSCF(BaseAlgorithm[pLSCFRunParams, pLSCFResult, npt.NDArray[np.float64]]):
     """
     Implementation of the poly-reference Least Square Complex Frequency (pLSCF) algorithm for modal analysis.
 
@@ -36,7 +38,7 @@ class pLSCF(BaseAlgorithm[pLSCFRunParams, pLSCFResult, typing.Iterable[float]]):
     ----------
     BaseAlgorithm : type
         Inherits from the BaseAlgorithm class with specified type parameters for pLSCFRunParams, pLSCFResult,
-        and Iterable[float].
+        and NDArray[np.float64].
 
     Attributes
     ----------
@@ -209,6 +211,8 @@ class pLSCF(BaseAlgorithm[pLSCFRunParams, pLSCFResult, typing.Iterable[float]]):
         Any
             The results of the modal parameter estimation based on user selection from the plot.
         """
+        from pyoma2.support.sel_from_plot import SelFromPlot
+
         super().mpe_from_plot(freqlim=freqlim, rtol=rtol)
 
         # Save run parameters
@@ -259,6 +263,8 @@ class pLSCF(BaseAlgorithm[pLSCFRunParams, pLSCFResult, typing.Iterable[float]]):
         Any
             A tuple containing the matplotlib figure and axes objects for the stability diagram.
         """
+        from pyoma2.functions import plot
+
         fig, ax = plot.stab_plot(
             Fn=self.result.Fn_poles,
             Lab=self.result.Lab,
@@ -295,6 +301,8 @@ class pLSCF(BaseAlgorithm[pLSCFRunParams, pLSCFResult, typing.Iterable[float]]):
         typing.Any
             A tuple containing the matplotlib figure and axes of the cluster diagram plot.
         """
+        from pyoma2.functions import plot
+
         if not self.result:
             raise ValueError("Run algorithm first")
 
@@ -11,10 +11,12 @@ from __future__ import annotations
 import logging
 import typing
 
+import numpy as np
+import numpy.typing as npt
+
 from pyoma2.algorithms.data.result import SSIResult
 from pyoma2.algorithms.data.run_params import SSIRunParams
-from pyoma2.functions import gen, plot, ssi
-from pyoma2.support.sel_from_plot import SelFromPlot
+from pyoma2.functions import gen, ssi
 
 from .base import BaseAlgorithm
 
@@ -25,7 +27,7 @@ logger = logging.getLogger(__name__)
 # SINGLE SETUP
 # =============================================================================
 # (REF)DATA-DRIVEN STOCHASTIC SUBSPACE IDENTIFICATION
-class SSIdat(BaseAlgorithm[SSIRunParams, SSIResult, typing.Iterable[float]]):
+class SSIdat(BaseAlgorithm[SSIRunParams, SSIResult, npt.NDArray[np.float64]]):
     """
     Data-Driven Stochastic Subspace Identification (SSI) algorithm for single setup
     analysis.
@@ -253,6 +255,8 @@ class SSIdat(BaseAlgorithm[SSIRunParams, SSIResult, typing.Iterable[float]]):
             The extracted modal parameters after interactive selection. Format depends on algorithm's
             implementation.
         """
+        from pyoma2.support.sel_from_plot import SelFromPlot
+
         super().mpe_from_plot(freqlim=freqlim, rtol=rtol)
 
         # Save run parameters
@@ -318,6 +322,8 @@ class SSIdat(BaseAlgorithm[SSIRunParams, SSIResult, typing.Iterable[float]]):
         typing.Any
             A tuple containing the matplotlib figure and axes of the Stability Diagram plot.
         """
+        from pyoma2.functions import plot
+
         if not self.result:
             raise ValueError("Run algorithm first")
 
@@ -358,6 +364,8 @@ class SSIdat(BaseAlgorithm[SSIRunParams, SSIResult, typing.Iterable[float]]):
         typing.Any
             A tuple containing the matplotlib figure and axes of the cluster diagram plot.
         """
+        from pyoma2.functions import plot
+
         if not self.result:
             raise ValueError("Run algorithm first")
 
@@ -397,6 +405,8 @@ class SSIdat(BaseAlgorithm[SSIRunParams, SSIResult, typing.Iterable[float]]):
         ValueError
             If the algorithm has not been run before plotting.
         """
+        from pyoma2.functions import plot
+
         if not self.result:
             raise ValueError("Run algorithm first")
 
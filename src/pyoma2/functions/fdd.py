@@ -7,13 +7,14 @@ Dag Pasca
 
 import logging
 import typing
+import warnings
 
 import numpy as np
-from scipy import signal
-from scipy.optimize import curve_fit
-from tqdm import tqdm, trange
+import numpy.typing as npt
+from scipy import fft, signal
+from tqdm import trange
 
-from .gen import MAC
+from pyoma2.support.utils.jit import njit
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +29,7 @@ def SD_PreGER(
     nxseg: int = 1024,
     pov: float = 0.5,
     method: typing.Literal["per", "cor"] = "per",
+    dtype: npt.DTypeLike = np.complex128,
 ):
     """
     Estimate the PSD matrix for a multi-setup experiment using either the correlogram
@@ -49,6 +51,10 @@ def SD_PreGER(
     method : str, optional
         Method for spectral density estimation. 'per' for periodogram and 'cor' for
         correlogram method. Default is 'per'.
+    dtype : data-type, optional
+        Complex dtype of the returned spectral density matrices, e.g. ``np.complex64``
+        to halve their memory (they are always computed in double precision).
+        Default is ``np.complex128``.
 
     Returns
     -------
@@ -74,48 +80,119 @@ def SD_PreGER(
     for ii in trange(n_setup):
         logger.debug("Analyising setup nr.: %s...", ii)
 
-        Y_ref = Y[ii]["ref"]
-        Y_mov = Y[ii]["mov"]
-        # Ndat =  Y[ii]["ref"].shape[1] # number of data points
         Y_all = np.vstack((Y[ii]["ref"], Y[ii]["mov"]))
         # r = Y_all.shape[0] # total sensor for the ii setup
 
-        if method == "per":
-            # noverlap = nxseg*pov
-            freq, Sy_allref = SD_est(Y_all, Y_ref, dt, nxseg, method)
-            _, Sy_allmov = SD_est(Y_all, Y_mov, dt, nxseg, method)
-            Gyy.append(np.hstack((Sy_allref, Sy_allmov)))
-
-        elif method == "cor":
-            freq, Sy_allref = SD_est(Y_all, Y_ref, dt, nxseg, method)
-            _, Sy_allmov = SD_est(Y_all, Y_mov, dt, nxseg, method)
-            Gyy.append(np.hstack((Sy_allref, Sy_allmov)))
+        # Spectra of all the sensors (reference + moving) wrt all the sensors
+        freq, Sy_all = SD_est(Y_all, Y_all, dt, nxseg, method=method, pov=pov)
+        # frequency as first axis, so to work on stacks of [r x r] matrices
+        Gyy.append(np.moveaxis(Sy_all, 2, 0))
         logger.debug("... Done with setup nr.: %s!", ii)
 
-    Gy_refref = (
-        1 / n_setup * np.sum([Gyy[ii][:n_ref, :n_ref] for ii in range(n_setup)], axis=0)
-    )
-
-    Gg = []
-    # Scale spectrum to reference spectrum
-    for ff in range(len(freq)):
-        G1 = [
-            np.dot(
-                np.dot(
-                    Gyy[ii][n_ref:, :n_ref][:, :, ff],
-                    np.linalg.inv(Gyy[ii][:n_ref, :n_ref][:, :, ff]),
-                ),
-                Gy_refref[:, :, ff],
-            )
-            for ii in range(n_setup)
-        ]
-        G2 = np.vstack(G1)
-        G3 = np.vstack([Gy_refref[:, :, ff], G2])
-        Gg.append(G3)
+    Gy_refref = np.mean([G[:, :n_ref, :n_ref] for G in Gyy], axis=0)
 
-    Sy = np.array(Gg)
+    # Scale spectrum to reference spectrum (for all the frequencies at once)
+    G_movs = [
+        G[:, n_ref:, :n_ref] @ np.linalg.inv(G[:, :n_ref, :n_ref]) @ Gy_refref
+        for G in Gyy
+    ]
+
+    Sy = np.concatenate([Gy_refref, *G_movs], axis=1)
     Sy = np.moveaxis(Sy, 0, 2)
-    return freq, Sy
+    return freq, Sy.astype(dtype, copy=False)
+
+
+# -----------------------------------------------------------------------------
+
+
+def SD_welch(
+    Yall: np.ndarray,
+    Yref: np.ndarray,
+    fs: float,
+    nperseg: int,
+    noverlap: int,
+    window: str,
+    nfft: typing.Optional[int] = None,
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Estimate the one-sided Cross-Spectral Density between all the channels of `Yall`
+    and `Yref` with Welch's method.
+
+    The result is the same as the one of ``scipy.signal.csd`` (constant detrending,
+    density scaling, mean averaging), but the windowed segments of every channel are
+    transformed only once, with ``scipy.fft.rfft`` running on all the available
+    threads, and the products of the segments are averaged with one batched matrix
+    product for all the frequency lines.
+
+    Parameters
+    ----------
+    Yall : ndarray
+        Input signal data, with shape (n_all, Ndat).
+    Yref : ndarray
+        Reference signal data, with shape (n_ref, Ndat).
+    fs : float
+        Sampling frequency.
+    nperseg : int
+        Length of each segment. As in ``scipy.signal.csd``, it is reduced to the
+        number of data points if the signals are shorter.
+    noverlap : int
+        Number of points of overlap between segments.
+    window : str
+        Window applied to each segment, passed to ``scipy.signal.get_window``.
+    nfft : int, optional
+        Length of the FFT, the segments are zero-padded if ``nfft > nperseg``.
+        Default is ``nperseg``.
+
+    Returns
+    -------
+    tuple
+        freq : ndarray
+            Array of frequencies.
+        Pxy : ndarray
+            Cross-Spectral Density, with shape (n_all, n_ref, nfft//2 + 1).
+
+    Raises
+    ------
+    ValueError
+        If ``noverlap`` is not smaller than ``nperseg``.
+    """
+    Ndat = Yall.shape[-1]
+    if nperseg > Ndat:
+        warnings.warn(
+            f"nperseg = {nperseg} is greater than input length = {Ndat}, "
+            f"using nperseg = {Ndat}",
+            stacklevel=2,
+        )
+        nperseg = Ndat
+    if nfft is None:
+        nfft = nperseg
+    if noverlap >= nperseg:
+        raise ValueError("noverlap must be less than nperseg.")
+    win = signal.get_window(window, nperseg)
+    scale = 1.0 / (fs * np.sum(win**2))
+    step = nperseg - noverlap
+
+    def _segments_fft(Y):
+        # windowed, detrended segments with shape (nch, nseg, nperseg)
+        segs = np.lib.stride_tricks.sliding_window_view(Y, nperseg, axis=-1)[:, ::step]
+        segs = segs - np.mean(segs, axis=-1, keepdims=True)
+        return fft.rfft(segs * win, n=nfft, axis=-1, workers=-1)
+
+    Xall = _segments_fft(np.asarray(Yall))
+    Xref = Xall if Yref is Yall else _segments_fft(np.asarray(Yref))
+    nseg = Xall.shape[1]
+
+    # mean over the segments of conj(Xall) * Xref, as a stack of (n_all x nseg) @
+    # (nseg x n_ref) products, one per frequency line
+    Pxy = np.conj(Xall.transpose(2, 0, 1)) @ Xref.transpose(2, 1, 0)
+    Pxy = Pxy.transpose(1, 2, 0) * (scale / nseg)
+    # one-sided spectrum
+    if nfft % 2:
+        Pxy[..., 1:] *= 2
+    else:
+        Pxy[..., 1:-1] *= 2
+    freq = fft.rfftfreq(nfft, 1 / fs)
+    return freq, Pxy
 
 
 # -----------------------------------------------------------------------------
@@ -128,6 +205,7 @@ def SD_est(
     nxseg=1024,
     method="cor",
     pov=0.5,
+    dtype=np.complex128,
 ):
     """
     Estimate the Cross-Spectral Density (CSD) using either the correlogram method or the
@@ -148,6 +226,10 @@ def SD_est(
         periodogram. Default is "cor".
     pov : float, optional
         Proportion of overlap for the periodogram method. Default is 0.5.
+    dtype : data-type, optional
+        Complex dtype of the returned CSD, e.g. ``np.complex64`` to halve the memory
+        of the spectra (the estimate is always computed in double precision).
+        Default is ``np.complex128``.
 
     Returns
     -------
@@ -158,41 +240,30 @@ def SD_est(
             Cross-Spectral Density (CSD) estimation.
     """
     if method == "cor":
-        Ndat = Yref.shape[1]  # number of data points
-        n_ref = Yref.shape[0]
-        n_all = Yall.shape[0]
         # Calculating Auto e Cross-Spectral Density (Y_all, Y_ref)
-        _, Pxy = signal.csd(
-            Yall.reshape(n_all, 1, Ndat),
-            Yref.reshape(1, n_ref, Ndat),
-            nperseg=nxseg // 2,
-            nfft=nxseg,
-            noverlap=0,
-            window="boxcar",
+        _, Pxy = SD_welch(
+            Yall, Yref, 1.0, nperseg=nxseg // 2, noverlap=0, window="boxcar", nfft=nxseg
         )
-        Rxy = np.fft.irfft(Pxy)
+        Rxy = fft.irfft(Pxy, workers=-1)
 
         tau = -Rxy.shape[2] / np.log(0.01)
         win = signal.windows.exponential(Rxy.shape[2], center=0, tau=tau, sym=False)
         Rxy *= win
-        Sy = np.fft.rfft(Rxy)
+        Sy = fft.rfft(Rxy, workers=-1)
         freq = np.arange(0, Sy.shape[2]) * (1 / dt / (nxseg))  # Frequency vector
 
     elif method == "per":
         noverlap = nxseg * pov
-        Ndat = Yref.shape[1]
-        n_ref = Yref.shape[0]
-        n_all = Yall.shape[0]
         # Calculating Auto e Cross-Spectral Density (Y_all, Y_ref)
-        freq, Sy = signal.csd(
-            Yall.reshape(n_all, 1, Ndat),
-            Yref.reshape(1, n_ref, Ndat),
-            fs=1 / dt,
+        freq, Sy = SD_welch(
+            Yall,
+            Yref,
+            1 / dt,
             nperseg=nxseg,
-            noverlap=noverlap,
+            noverlap=int(noverlap),
             window="hann",
         )
-    return freq, Sy
+    return freq, Sy.astype(dtype, copy=False)
 
 
 # -----------------------------------------------------------------------------
@@ -216,17 +287,21 @@ def SD_svalsvec(SD):
             Singular values.
         S_vec : ndarray
             Singular vectors.
+
+    Note
+    -----
+    The decomposition is computed in the precision of `SD`, i.e. in single precision
+    for ``complex64`` spectra.
     """
     nr, nc, nf = SD.shape
-    Sval = np.zeros((nf, nc))
-    S_val = np.empty((nf, nc, nc))
-    S_vec = np.empty((nf, nr, nr), dtype=complex)
-    for k in range(nf):
-        U1, S, _ = np.linalg.svd(SD[:, :, k])
-        U1_1 = U1.conj().T
-        Sval[k, :] = np.sqrt(S)
-        S_val[k, :, :] = np.diag(np.sqrt(S))
-        S_vec[k, :, :] = U1_1
+    # SVD of all the frequency lines at once (stack of [nr x nc] matrices)
+    U1, S, _ = np.linalg.svd(np.moveaxis(SD, 2, 0))
+    ns = S.shape[1]
+    S_val = np.zeros((nf, nc, nc), dtype=S.dtype)
+    S_val[:, np.arange(ns), np.arange(ns)] = np.sqrt(S)
+    # complex singular vectors, with the same precision as SD
+    vec_dtype = np.result_type(U1.dtype, np.complex64)
+    S_vec = np.conj(np.swapaxes(U1, 1, 2)).astype(vec_dtype, copy=False)
     S_val = np.moveaxis(S_val, 0, 2)
     S_vec = np.moveaxis(S_vec, 0, 2)
     return S_val, S_vec
@@ -269,54 +344,59 @@ def FDD_mpe(
         Phi : ndarray
             Corresponding normalized mode shapes (each column corresponds to a mode shape).
 
+    Raises
+    ------
+    ValueError
+        If there are no frequency lines within the bandwidth of a selected frequency.
+
     Note
     -----
     The function assumes that the first singular value and vector correspond to the dominant
     mode at each frequency point.
     """
     # Sval, Svec = SD_svalsvec(Sy)
-    Nch, Nref, Nf = Sval.shape
-
-    Freq = []
-    Fi = []
-    index = []
-    maxSy_diff = []
     logger.info("Extracting FDD modal parameters")
-    for sel_fn in tqdm(sel_freq):
-        # Frequency bandwidth where the peak is searched
-        lim = (sel_fn - DF, sel_fn + DF)
-        idxlim = (
-            np.argmin(np.abs(freq - lim[0])),
-            np.argmin(np.abs(freq - lim[1])),
-        )  # Indices of the limits
-        # Ratios between the first and second singular value
-        diffS1S2 = Sval[0, 0, idxlim[0] : idxlim[1]] / Sval[1, 1, idxlim[0] : idxlim[1]]
-        maxDiffS1S2 = np.max(diffS1S2)  # Looking for the maximum difference
-        idx1 = np.argmin(np.abs(diffS1S2 - maxDiffS1S2))  # Index of the max diff
-        idxfin = idxlim[0] + idx1  # Final index
-
-        # Modal properties
-        fn_FDD = freq[idxfin]  # Frequency
-        phi_FDD = Svec[0, :, idxfin]  # Mode shape
-        # Normalized (unity displacement)
-        phi_FDDn = phi_FDD / phi_FDD[np.argmax(np.abs(phi_FDD))]
-
-        Freq.append(fn_FDD)
-        Fi.append(phi_FDDn)
-        index.append(idxfin)
-        maxSy_diff.append(maxDiffS1S2)
+    sel_freq = np.asarray(sel_freq, dtype=float)
+    # Indices of the limits of the frequency bandwidth where each peak is searched
+    idx_lo = np.argmin(np.abs(freq[None, :] - (sel_freq - DF)[:, None]), axis=1)
+    idx_hi = np.argmin(np.abs(freq[None, :] - (sel_freq + DF)[:, None]), axis=1)
+    if np.any(idx_hi <= idx_lo):
+        raise ValueError(
+            "No frequency lines within the bandwidth DF around the selected frequencies, "
+            "increase DF or the frequency resolution"
+        )
+    # Ratios between the first and second singular value
+    diffS1S2 = Sval[0, 0, :] / Sval[1, 1, :]
+    # Looking for the maximum ratio within each bandwidth (one row per sel_freq)
+    kk = np.arange(freq.shape[0])
+    inband = (kk[None, :] >= idx_lo[:, None]) & (kk[None, :] < idx_hi[:, None])
+    idxfin = np.argmax(np.where(inband, diffS1S2[None, :], -np.inf), axis=1)
+
+    # Modal properties
+    Fn = freq[idxfin]  # Frequency
+    Phi = Svec[0][:, idxfin]  # Mode shapes (one per column)
+    # Normalized (unity displacement)
+    Phi = Phi / Phi[np.argmax(np.abs(Phi), axis=0), np.arange(Phi.shape[1])]
     logger.debug("Done!")
 
-    Fn = np.array(Freq)
-    Phi = np.array(Fi).T
-    index = np.array(index)
     return Fn, Phi
 
 
 # -----------------------------------------------------------------------------
 # COMMENT
 # Utility function (Hidden for users?)
-def SDOF_bellandMS(Sy, dt, sel_fn, phi_FDD, method="FSDD", cm=1, MAClim=0.85, DF=1.0):
+def SDOF_bellandMS(
+    Sy,
+    dt,
+    sel_fn,
+    phi_FDD,
+    method="FSDD",
+    cm=1,
+    MAClim=0.85,
+    DF=1.0,
+    Sval=None,
+    Svec=None,
+):
     """
     Computes the SDOF bell and mode shapes for a specified frequency range using FSDD or
     EFDD methods.
@@ -341,6 +421,10 @@ def SDOF_bellandMS(Sy, dt, sel_fn, phi_FDD, method="FSDD", cm=1, MAClim=0.85, DF
         Threshold for the Modal Assurance Criterion (MAC) to filter modes. Default is 0.85.
     DF : float, optional
         Frequency bandwidth around the selected frequency for analysis. Default is 1.0.
+    Sval, Svec : ndarray, optional
+        Singular values and vectors of `Sy`, as returned by `SD_svalsvec`. If not given
+        they are computed from `Sy`. Passing them avoids decomposing the whole spectral
+        matrix again for every selected mode.
 
     Returns
     -------
@@ -351,7 +435,8 @@ def SDOF_bellandMS(Sy, dt, sel_fn, phi_FDD, method="FSDD", cm=1, MAClim=0.85, DF
             The mode shapes corresponding to the SDOF bell.
     """
 
-    Sval, Svec = SD_svalsvec(Sy)
+    if Sval is None or Svec is None:
+        Sval, Svec = SD_svalsvec(Sy)
     Nch = phi_FDD.shape[0]
     nxseg = Sval.shape[2]
     freq = np.arange(0, nxseg) * (1 / dt / (2 * nxseg))
@@ -365,44 +450,28 @@ def SDOF_bellandMS(Sy, dt, sel_fn, phi_FDD, method="FSDD", cm=1, MAClim=0.85, DF
     SDOFbell = np.zeros(len(np.arange(idxlim[0], idxlim[1])), dtype=complex)
     SDOFms = np.zeros((len(np.arange(idxlim[0], idxlim[1])), Nch), dtype=complex)
 
+    band = slice(int(idxlim[0]), int(idxlim[1]))
+    phi_norm = np.einsum("c,c->", phi_FDD.conj(), phi_FDD).real
+
     for csm in range(cm):  # Loop through close mode (if any, default 1)
         # Frequency Spatial Domain Decomposition variation (defaulf)
         if method == "FSDD":
-            # Save values that satisfy MAC > MAClim condition
-            SDOFbell += np.array(
-                [
-                    np.dot(
-                        np.dot(phi_FDD.conj().T, Sy[:, :, el]), phi_FDD
-                    )  # Enhanced PSD matrix (frequency filtered)
-                    if MAC(phi_FDD, Svec[csm, :, el]) > MAClim
-                    else 0
-                    for el in range(int(idxlim[0]), int(idxlim[1]))
-                ]
-            )
-            # Do the same for mode shapes
-            SDOFms += np.array(
-                [
-                    Svec[csm, :, el]
-                    if MAC(phi_FDD, Svec[csm, :, el]) > MAClim
-                    else np.zeros(Nch)
-                    for el in range(int(idxlim[0]), int(idxlim[1]))
-                ]
+            # Enhanced PSD matrix (frequency filtered)
+            bell = np.einsum(
+                "c,cdf,d->f", phi_FDD.conj(), Sy[:, :, band], phi_FDD, optimize="greedy"
             )
         elif method == "EFDD":
-            SDOFbell += np.array(
-                [
-                    Sval[csm, csm, l_] if MAC(phi_FDD, Svec[csm, :, l_]) > MAClim else 0
-                    for l_ in range(int(idxlim[0]), int(idxlim[1]))
-                ]
-            )
-            SDOFms += np.array(
-                [
-                    Svec[csm, :, l_]
-                    if MAC(phi_FDD, Svec[csm, :, l_]) > MAClim
-                    else np.zeros(Nch)
-                    for l_ in range(int(idxlim[0]), int(idxlim[1]))
-                ]
-            )
+            bell = Sval[csm, csm, band]
+        else:
+            continue
+        # MAC between the reference mode shape and the singular vectors in the band
+        svec = Svec[csm, :, band]
+        mac = np.abs(np.einsum("c,cf->f", phi_FDD.conj(), svec, optimize="greedy")) ** 2
+        mac /= phi_norm * np.einsum("cf,cf->f", svec.conj(), svec).real
+        # Save values (and mode shapes) that satisfy MAC > MAClim condition
+        keep = mac > MAClim
+        SDOFbell += np.where(keep, bell, 0)
+        SDOFms += np.where(keep[:, None], svec.T, 0)
 
     SDOFbell1 = np.zeros((nxseg), dtype=complex)
     SDOFms1 = np.zeros((nxseg, Nch), dtype=complex)
@@ -414,6 +483,49 @@ def SDOF_bellandMS(Sy, dt, sel_fn, phi_FDD, method="FSDD", cm=1, MAClim=0.85, DF
 # -----------------------------------------------------------------------------
 
 
+@njit(cache=True)
+def EFDD_minmax(normSDOFcorr: np.ndarray) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the alternating minimums and maximums (peaks) of a normalised autocorrelation
+    function, i.e. the extremes between every second zero crossing.
+
+    Parameters
+    ----------
+    normSDOFcorr : ndarray
+        Normalised autocorrelation function (free decay) of the SDOF system.
+
+    Returns
+    -------
+    tuple
+        minmax : ndarray
+            Values of the peaks, ordered as [min_0, max_0, min_1, max_1, ...].
+        minmax_idx : ndarray
+            Indices of the peaks in `normSDOFcorr`.
+
+    Note
+    -----
+    The function is compiled with numba when the optional package is installed.
+    """
+    # finding where the sign changes (crossing x)
+    zc1 = np.nonzero(np.diff(np.sign(normSDOFcorr)))[0]  # Zero crossing indices
+    npk = max(0, (len(zc1) - 1) // 2)  # number of (min, max) couples
+
+    minmax = np.empty(2 * npk)
+    minmax_idx = np.empty(2 * npk, dtype=np.int64)
+    for kk in range(npk):
+        seg = normSDOFcorr[zc1[2 * kk] : zc1[2 * kk + 2]]
+        idx_min = np.argmin(seg)
+        idx_max = np.argmax(seg)
+        minmax[2 * kk] = seg[idx_min]
+        minmax[2 * kk + 1] = seg[idx_max]
+        minmax_idx[2 * kk] = zc1[2 * kk] + idx_min
+        minmax_idx[2 * kk + 1] = zc1[2 * kk] + idx_max
+    return minmax, minmax_idx
+
+
+# -----------------------------------------------------------------------------
+
+
 def EFDD_mpe(
     Sy: np.ndarray,
     freq: np.ndarray,
@@ -490,56 +602,53 @@ def EFDD_mpe(
     Xi_E = []
 
     logger.info("Extracting EFDD modal parameters")
+    SDOFbells = []
     for n in trange(len(sel_freq)):  # looping through all frequencies to estimate
         phi_FDD = Phi_FDD[:, n]  # Select reference mode shape (from FDD)
         sel_fn = sel_freq[n]
         SDOFbell, SDOFms = SDOF_bellandMS(
-            Sy, dt, sel_fn, phi_FDD, method=method, cm=cm, MAClim=MAClim, DF=DF2
+            Sy,
+            dt,
+            sel_fn,
+            phi_FDD,
+            method=method,
+            cm=cm,
+            MAClim=MAClim,
+            DF=DF2,
+            Sval=Sval,
+            Svec=Svec,
         )
+        SDOFbells.append(SDOFbell)
 
-        # indices of the singular values in SDOFsval
-        idSV = np.array(np.where(SDOFbell)).T
-        # Autocorrelation function (Free Decay)
-        SDOFcorr1 = np.fft.ifft(SDOFbell, n=nIFFT, axis=0, norm="ortho").real
-        df = 1 / dt / nxseg
-        tlag = 1 / df  # time lag
-        time = np.linspace(0, tlag, len(SDOFcorr1) // 2)  # t
+    # Autocorrelation functions (Free Decay) of all the SDOF bells, one per row
+    SDOFbells = np.array(SDOFbells).reshape(len(sel_freq), nxseg)
+    SDOFcorr = fft.ifft(SDOFbells, n=nIFFT, axis=1, norm="ortho", workers=-1).real
+    df = 1 / dt / nxseg
+    tlag = 1 / df  # time lag
+    time = np.linspace(0, tlag, nIFFT // 2)  # t
 
-        # NORMALISED AUTOCORRELATION
-        normSDOFcorr = SDOFcorr1[: len(SDOFcorr1) // 2] / SDOFcorr1[np.argmax(SDOFcorr1)]
+    # NORMALISED AUTOCORRELATION
+    normSDOFcorrs = SDOFcorr[:, : nIFFT // 2] / np.max(SDOFcorr, axis=1, keepdims=True)
 
-        # finding where x = 0
-        sgn = np.sign(normSDOFcorr).real  # finding the sign
-        # finding where the sign changes (crossing x)
-        sgn1 = np.diff(sgn, axis=0)
-        zc1 = np.where(sgn1)[0]  # Zero crossing indices
+    for n in range(len(sel_freq)):
+        phi_FDD = Phi_FDD[:, n]
+        sel_fn = sel_freq[n]
+        SDOFbell = SDOFbells[n]
+        normSDOFcorr = normSDOFcorrs[n]
+        # indices of the singular values in SDOFsval
+        idSV = np.array(np.where(SDOFbell)).T
 
         # finding maximums and minimums (peaks) of the autoccorelation
-        maxSDOFcorr = [
-            np.max(normSDOFcorr[zc1[_i] : zc1[_i + 2]])
-            for _i in range(0, len(zc1) - 2, 2)
-        ]
-        minSDOFcorr = [
-            np.min(normSDOFcorr[zc1[_i] : zc1[_i + 2]])
-            for _i in range(0, len(zc1) - 2, 2)
-        ]
-        if len(maxSDOFcorr) > len(minSDOFcorr):
-            maxSDOFcorr = maxSDOFcorr[:-1]
-        elif len(maxSDOFcorr) < len(minSDOFcorr):
-            minSDOFcorr = minSDOFcorr[:-1]
-
-        minmax = np.array((minSDOFcorr, maxSDOFcorr))
-        minmax = np.ravel(minmax, order="F")
-
-        # finding the indices of the peaks
-        maxSDOFcorr_idx = [np.argmin(abs(normSDOFcorr - maxx)) for maxx in maxSDOFcorr]
-        minSDOFcorr_idx = [np.argmin(abs(normSDOFcorr - minn)) for minn in minSDOFcorr]
-        minmax_idx = np.array((minSDOFcorr_idx, maxSDOFcorr_idx))
-        minmax_idx = np.ravel(minmax_idx, order="F")
+        minmax, minmax_idx = EFDD_minmax(normSDOFcorr)
+        if len(minmax) < sppk + npmax:
+            raise IndexError(
+                f"Only {len(minmax)} peaks found in the autocorrelation of the mode "
+                f"at {sel_fn} Hz, but sppk + npmax = {sppk + npmax} are required"
+            )
 
         # Peacks and indices of the peaks to be used in the fitting
-        minmax_fit = np.array([minmax[_a] for _a in range(sppk, sppk + npmax)])
-        minmax_fit_idx = np.array([minmax_idx[_a] for _a in range(sppk, sppk + npmax)])
+        minmax_fit = minmax[sppk : sppk + npmax]
+        minmax_fit_idx = minmax_idx[sppk : sppk + npmax]
 
         # estimating the natural frequency from the distance between the peaks
         # *2 because we use both max and min
@@ -549,18 +658,11 @@ def EFDD_mpe(
         fd_EFDD = 1 / Td_EFDD  # damped natural frequency
 
         # Log decrement
-        delta = np.array(
-            [
-                1 * np.log(np.abs(minmax[0]) / np.abs(minmax[ii]))
-                for ii in range(len(minmax_fit))
-            ]
-        )
-
-        # Fit
-        def _fit(x, m):
-            return m * x
+        delta = np.log(np.abs(minmax[0]) / np.abs(minmax[: len(minmax_fit)]))
 
-        lam, _ = curve_fit(_fit, np.arange(len(minmax_fit)), delta)
+        # Fit (least squares line through the origin, delta = lam * k)
+        kk = np.arange(len(minmax_fit))
+        lam = np.array([np.dot(kk, delta) / np.dot(kk, kk)])
 
         # damping ratio
         if methodSy == "cor":  # correct for exponential window
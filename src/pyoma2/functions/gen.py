@@ -6,7 +6,10 @@ Author:
 Dag Pasca
 """
 
+import copy
+import functools
 import logging
+import os
 import pickle
 import typing
 
@@ -14,6 +17,8 @@ import numpy as np
 import pandas as pd
 from scipy import linalg, signal
 
+from pyoma2.support.utils.jit import njit, prange
+
 logger = logging.getLogger(__name__)
 
 
@@ -252,36 +257,75 @@ def SC_apply(Fn, Xi, Phi, ordmin, ordmax, step, err_fn, err_xi, err_phi) -> np.n
 
     # SOFT CONDITIONS
     # STABILITY BETWEEN CONSECUTIVE ORDERS
-    for oo in range(ordmin, ordmax + 1, step):
-        o = int(oo / step)
+    orders = np.array([int(oo / step) for oo in range(ordmin, ordmax + 1, step)])
+    # Skip the first order as it has no previous order to compare with
+    orders = orders[orders != 0]
+    if orders.size > 0 and orders.max() >= Fn.shape[1]:
+        raise IndexError(
+            f"Model order {orders.max() * step} exceeds the orders in Fn "
+            f"({Fn.shape[1]} columns)"
+        )
+    SC_kernel(Fn, Xi, Phi, orders, err_fn, err_xi, err_phi, Lab)
+    return Lab
 
-        f_n = Fn[:, o].reshape(-1, 1)
-        xi_n = Xi[:, o].reshape(-1, 1)
-        phi_n = Phi[:, o, :]
 
-        f_n1 = Fn[:, o - 1].reshape(-1, 1)
-        xi_n1 = Xi[:, o - 1].reshape(-1, 1)
-        phi_n1 = Phi[:, o - 1, :]
+# -----------------------------------------------------------------------------
 
-        # Skip the first order as it has no previous order to compare with
-        if o == 0:
-            continue
 
-        for i in range(len(f_n)):
-            try:
-                idx = np.nanargmin(np.abs(f_n1 - f_n[i]))
-
-                cond1 = np.abs(f_n[i] - f_n1[idx]) / f_n[i]
-                cond2 = np.abs(xi_n[i] - xi_n1[idx]) / xi_n[i]
-                cond3 = 1 - MAC(phi_n[i, :], phi_n1[idx, :])
-                if cond1 < err_fn and cond2 < err_xi and cond3 < err_phi:
-                    Lab[i, o] = 1  # Stable
-                else:
-                    Lab[i, o] = 0  # Nuovo polo o polo instabile
-            except Exception as e:
-                # If f_n[i] is nan, do nothin, n.b. the lab stays 0
-                logger.debug(e)
-    return Lab
+@njit(parallel=True, cache=True, error_model="numpy")
+def SC_kernel(Fn, Xi, Phi, orders, err_fn, err_xi, err_phi, Lab) -> None:
+    """
+    Compute the labels of the Soft validation Criteria, comparing each pole of the given
+    orders with the closest pole (in frequency) of the previous order.
+
+    The function is compiled with numba, running the orders in parallel, if numba is
+    installed. Otherwise it runs as plain Python/NumPy code.
+
+    Parameters
+    ----------
+    Fn : np.ndarray
+        Array of natural frequencies, with shape (n_modes, n_orders).
+    Xi : np.ndarray
+        Array of damping ratios, with shape (n_modes, n_orders).
+    Phi : np.ndarray
+        Array of mode shapes, with shape (n_modes, n_orders, n_ch).
+    orders : np.ndarray
+        Indices of the orders (columns of `Fn`) to check, all greater than 0.
+    err_fn : float
+        Tolerance for the natural frequency error.
+    err_xi : float
+        Tolerance for the damping ratio error.
+    err_phi : float
+        Tolerance for the mode shape error.
+    Lab : np.ndarray
+        Array of labels with the same shape as `Fn`, set in place to 1 for the stable
+        poles (the other values are not modified).
+    """
+    n_modes = Fn.shape[0]
+    for kk in prange(orders.shape[0]):
+        o = orders[kk]
+        f_n1 = Fn[:, o - 1]
+        if np.all(np.isnan(f_n1)):
+            continue
+        for i in range(n_modes):
+            f_n = Fn[i, o]
+            # If f_n is nan, do nothing, n.b. the lab stays 0
+            if np.isnan(f_n):
+                continue
+            idx = np.nanargmin(np.abs(f_n1 - f_n))
+
+            cond1 = np.abs(f_n - f_n1[idx]) / f_n
+            cond2 = np.abs(Xi[i, o] - Xi[idx, o - 1]) / Xi[i, o]
+            # MAC between the two mode shapes
+            phi_n = Phi[i, o, :]
+            phi_n1 = Phi[idx, o - 1, :]
+            mac = np.abs(np.sum(np.conj(phi_n) * phi_n1)) ** 2 / (
+                np.sum(np.conj(phi_n) * phi_n).real
+                * np.sum(np.conj(phi_n1) * phi_n1).real
+            )
+            cond3 = 1 - mac
+            if cond1 < err_fn and cond2 < err_xi and cond3 < err_phi:
+                Lab[i, o] = 1  # Stable
 
 
 # -----------------------------------------------------------------------------
@@ -1262,12 +1306,10 @@ def MAC(phi_X: np.ndarray, phi_A: np.ndarray) -> np.ndarray:
     # )
     # original
     MAC = np.abs(np.conj(phi_X).T @ phi_A) ** 2
-    MAC = MAC.astype(complex)
-    for i in range(phi_X.shape[1]):
-        for j in range(phi_A.shape[1]):
-            MAC[i, j] = MAC[i, j] / (
-                np.conj(phi_X[:, i]) @ phi_X[:, i] * np.conj(phi_A[:, j]) @ phi_A[:, j]
-            )
+    # squared norms of the mode shapes, normalising all the pairs at once
+    norm_X = np.sum(np.abs(phi_X) ** 2, axis=0)
+    norm_A = np.sum(np.abs(phi_A) ** 2, axis=0)
+    MAC = MAC / np.outer(norm_X, norm_A)
 
     if MAC.shape == (1, 1):
         MAC = MAC[0, 0]
@@ -1466,6 +1508,29 @@ def load_from_file(file_name: str) -> object:
     return instance
 
 
+@functools.lru_cache(maxsize=16)
+def _read_excel_cached(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    sheet_name: typing.Optional[str],
+    engine: str,
+    index_col: int,
+    kwargs_items: tuple,
+) -> typing.Union[dict, pd.DataFrame]:
+    """
+    Cached call to pd.read_excel, used by `read_excel_file`. The modification time
+    and file size are part of the key, so that modified files are read again.
+    """
+    return pd.read_excel(
+        path,
+        sheet_name=sheet_name,
+        engine=engine,
+        index_col=index_col,
+        **dict(kwargs_items),
+    )
+
+
 def read_excel_file(
     path: str,
     sheet_name: typing.Optional[str] = None,
@@ -1500,12 +1565,41 @@ def read_excel_file(
         If the specified engine is not available.
     RuntimeError
         If an error occurs while reading the Excel file.
+
+    Note
+    -----
+    The contents of the files read from a path are cached in memory (together with the
+    reading options) and are read again only if the file is modified, a copy of the
+    cached contents is returned.
     """
     try:
-        file_dict = pd.read_excel(
-            path, sheet_name=sheet_name, engine=engine, index_col=index_col, **kwargs
-        )
-        return file_dict
+        try:
+            # files are cached by path, modification time and size, together with
+            # the reading options (pd.read_excel expands "~" as well)
+            realpath = os.path.realpath(os.path.expanduser(path))
+            stat = os.stat(realpath)
+            key = (
+                realpath,
+                stat.st_mtime_ns,
+                stat.st_size,
+                sheet_name,
+                engine,
+                index_col,
+                tuple(sorted(kwargs.items())),
+            )
+            hash(key)
+        except (TypeError, OSError):
+            # not a local file (e.g. a file-like object or a URL), or unhashable
+            # options: read without caching, pandas reports any error
+            key = None
+        if key is None:
+            file_dict = pd.read_excel(
+                path, sheet_name=sheet_name, engine=engine, index_col=index_col, **kwargs
+            )
+        else:
+            file_dict = _read_excel_cached(*key)
+        # return a copy, so that the cached dataframes are never modified
+        return copy.deepcopy(file_dict)
     except ImportError as e:
         raise ImportError(
             "Optional package 'openpyxl' is not installed. "
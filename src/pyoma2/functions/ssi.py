@@ -11,11 +11,19 @@ import typing
 
 import numpy as np
 from scipy import linalg
+from scipy.linalg import lapack
 from tqdm import tqdm, trange
 
 np.seterr(divide="ignore", invalid="ignore")
 logger = logging.getLogger(__name__)
 
+# smallest singular value ratio S[-1] / S[0] resolved through the Gram matrix in
+# SVD_trunc, below it a full SVD is computed
+SVD_TRUNC_RTOL = np.finfo(float).eps ** 0.25
+
+# optimal LAPACK gesdd workspace size, by (typecode, rows, columns, full_matrices)
+_GESDD_LWORK: typing.Dict[typing.Tuple[str, int, int, bool], int] = {}
+
 # =============================================================================
 # FUNZIONI SSI
 # =============================================================================
@@ -164,6 +172,114 @@ def build_hank(
 # -----------------------------------------------------------------------------
 
 
+def _svd(
+    H: np.ndarray, full_matrices: bool = False
+) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Singular value decomposition through the LAPACK divide-and-conquer driver gesdd.
+
+    The optimal workspace size is queried only once for each dtype and shape of `H`
+    and then reused, as the same decomposition is typically repeated on Hankel
+    matrices of the same size (e.g. for each setup of a multi-setup analysis).
+
+    Parameters
+    ----------
+    H : np.ndarray
+        The matrix to decompose. It is not modified.
+    full_matrices : bool, optional
+        If True, `U` and `V_t` are square, otherwise they are truncated to
+        min(H.shape) singular vectors. Default is False.
+
+    Returns
+    -------
+    U : np.ndarray
+        Left singular vectors.
+    S : np.ndarray
+        Singular values in descending order.
+    V_t : np.ndarray
+        Right singular vectors (transposed).
+
+    Raises
+    ------
+    np.linalg.LinAlgError
+        If the decomposition does not converge.
+    """
+    gesdd, gesdd_lwork = lapack.get_lapack_funcs(("gesdd", "gesdd_lwork"), (H,))
+    m, n = H.shape
+    key = (gesdd.typecode, m, n, full_matrices)
+    lwork = _GESDD_LWORK.get(key)
+    if lwork is None:
+        work, _ = gesdd_lwork(m, n, compute_uv=1, full_matrices=full_matrices)
+        lwork = _GESDD_LWORK[key] = int(work.real)
+    U, S, V_t, info = gesdd(
+        H, compute_uv=1, full_matrices=full_matrices, lwork=lwork, overwrite_a=0
+    )
+    if info != 0:
+        raise np.linalg.LinAlgError("SVD did not converge")
+    return U, S, V_t
+
+
+# -----------------------------------------------------------------------------
+
+
+def SVD_trunc(
+    H: np.ndarray, ordmax: int
+) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the first `ordmax` singular triplets of the Hankel matrix.
+
+    Parameters
+    ----------
+    H : np.ndarray
+        The Hankel matrix.
+    ordmax : int
+        Number of singular values (and vectors) to compute.
+
+    Returns
+    -------
+    U : np.ndarray
+        Left singular vectors, shape (H.shape[0], ordmax).
+    S : np.ndarray
+        Singular values in descending order, shape (ordmax,).
+    V_t : np.ndarray
+        Right singular vectors (transposed), shape (ordmax, H.shape[1]).
+
+    Note
+    -----
+    The singular triplets are recovered from the truncated eigendecomposition of the
+    (smaller) symmetric Gram matrix of `H`, so that only the `ordmax` leading
+    eigenpairs are computed. A full SVD is performed instead if `ordmax` is not
+    smaller than the smallest dimension of `H`, or if the smallest requested
+    singular value is below `SVD_TRUNC_RTOL` times the largest one. Through the Gram
+    matrix, the relative error of a singular value S[i] is about
+    eps * (S[0] / S[i])**2, so the threshold bounds it to about sqrt(eps).
+    """
+    nmin = min(H.shape)
+    wide = H.shape[0] <= H.shape[1]
+    full = not 0 < ordmax < nmin
+    if not full:
+        G = np.dot(H, H.T) if wide else np.dot(H.T, H)
+        # eigenvalues are returned in ascending order
+        lam, Q = linalg.eigh(G, subset_by_index=[nmin - ordmax, nmin - 1])
+        lam, Q = lam[::-1], Q[:, ::-1]
+        S = np.sqrt(np.clip(lam, 0, None))
+        full = S[-1] <= SVD_TRUNC_RTOL * S[0]
+    if full:
+        U, S, V_t = _svd(H)
+        return U[:, :ordmax], S[:ordmax], V_t[:ordmax, :]
+
+    if wide:
+        U = Q
+        V_t = np.dot(U.T, H) / S[:, None]
+    else:
+        V_t = Q.T
+        U = np.dot(H, Q) / S[None, :]
+    return U, S, V_t
+
+
+# -----------------------------------------------------------------------------
+
+
 def ac2mp(
     A: np.ndarray, C: np.ndarray, dt: float, calc_unc: bool = False
 ) -> typing.Tuple[
@@ -259,7 +375,7 @@ def SSI(
     """
     Nch = int(H.shape[0] / (br + 1))
     # SINGULAR VALUE DECOMPOSITION
-    U1, S1, V1_t = np.linalg.svd(H)
+    U1, S1, V1_t = _svd(H, full_matrices=True)
     S1rad = np.sqrt(np.diag(S1))
     # initializing arrays
     # Obs = np.dot(U1[:, :ordmax], S1rad[:ordmax, :ordmax]) # Observability matrix
@@ -340,9 +456,13 @@ def SSI_fast(
     q = int(p + 1)  # block column
 
     # SINGULAR VALUE DECOMPOSITION
-    U1, SIG, V1_t = np.linalg.svd(H)
+    if calc_unc is True:
+        U1, SIG, V1_t = _svd(H, full_matrices=True)
+        Vom = V1_t[:, :ordmax]
+    else:
+        # only the first ordmax singular triplets are needed
+        U1, SIG, V1_t = SVD_trunc(H, ordmax)
     Uom = U1[:, :ordmax]
-    Vom = V1_t[:, :ordmax]
     Som = SIG[:ordmax]
     S1rad = np.sqrt(np.diag(SIG))
     # initializing arrays
@@ -723,10 +843,12 @@ def SSI_multi_setup(
         # Build HANKEL MATRIX
         H, _ = build_hank(Y_all, Y_ref, br, method=method_hank, calc_unc=False)
         # SINGULAR VALUE DECOMPOSITION
-        U1, S1, V1_t = np.linalg.svd(H)
+        U1, S1, V1_t = SVD_trunc(H, ordmax)
         S1rad = np.sqrt(np.diag(S1))
         # Observability matrix
         Obs = np.dot(U1[:, :ordmax], S1rad[:ordmax, :ordmax])
+        # release the Hankel matrix and its SVD before the next setup is processed
+        del H, U1, S1, V1_t
         # get reference idexes
         ref_id = np.array([np.arange(br) * (n_ref + n_mov[kk]) + j for j in range(n_ref)])
         ref_id = ref_id.flatten(order="f")
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import logging
 import typing
+from pathlib import Path
 
 import numpy as np
 from scipy.signal import decimate, detrend
@@ -78,31 +79,45 @@ class BaseSetup:
         -----
         The algorithms must be instantiated before adding them to the setup,
         and their names must be unique.
+        Array data are converted in place to a float, column-major array (the layout
+        used by the algorithms, see ``BaseAlgorithm._set_data``), which the setup and
+        all its algorithms then share.
         """
+        if isinstance(self.data, np.ndarray):
+            # convert the data once, so that later calls reuse the same array
+            self.data = np.asfortranarray(self.data, dtype=float)
         self.algorithms = {
             **getattr(self, "algorithms", {}),
             **{alg.name: alg._set_data(data=self.data, fs=self.fs) for alg in algorithms},
         }
 
     # run the whole set of algorithms (methods). METODO 1 di tutti
-    def run_all(self) -> None:
+    def run_all(self, cache_dir: typing.Optional[typing.Union[str, Path]] = None) -> None:
         """
         Runs all the algorithms added to the setup.
 
         Iterates through each algorithm stored in the setup and executes it. The results are saved within
         each algorithm instance.
 
+        Parameters
+        ----------
+        cache_dir : str or Path, optional
+            If given, the results are saved to (and reused from) this directory, see
+            `BaseAlgorithm.run_cached`. Default is None (no cache).
+
         Notes
         -----
         This method assumes that all algorithms are properly initialized and can be executed without
         additional parameters.
         """
         for alg_name in self.algorithms:
-            self.run_by_name(name=alg_name)
+            self.run_by_name(name=alg_name, cache_dir=cache_dir)
         logger.info("all done")
 
     # run algorithm (method) by name. QUESTO è IL METODO 1 di un singolo
-    def run_by_name(self, name: str) -> None:
+    def run_by_name(
+        self, name: str, cache_dir: typing.Optional[typing.Union[str, Path]] = None
+    ) -> None:
         """
         Runs a specific algorithm by its name.
 
@@ -110,6 +125,9 @@ class BaseSetup:
         ----------
         name : str
             The name of the algorithm to be executed.
+        cache_dir : str or Path, optional
+            If given, the result is saved to (and reused from) this directory, see
+            `BaseAlgorithm.run_cached`. Default is None (no cache).
 
         Raises
         ------
@@ -122,6 +140,9 @@ class BaseSetup:
         """
         logger.info("Running %s...", name)
         logger.debug("...with parameters: %s", self[name].run_params)
+        if cache_dir is not None:
+            self[name].run_cached(cache_dir=cache_dir)
+            return
         self[name]._pre_run()
         result = self[name].run()
         logger.debug("...saving %s result", name)
@@ -12,6 +12,7 @@ from __future__ import annotations
 import copy
 import logging
 import typing
+from multiprocessing import shared_memory
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -63,6 +64,7 @@ class SingleSetup(BaseSetup, GeometryMixin):
     Ndat: int
     T: float
     algorithms: typing.Dict[str, BaseAlgorithm]
+    _shm: typing.Optional[shared_memory.SharedMemory] = None
 
     def __init__(self, data: np.ndarray, fs: float):
         """
@@ -86,8 +88,9 @@ class SingleSetup(BaseSetup, GeometryMixin):
 
         This method is called during the initialization of the SingleSetup instance.
         """
-        # Store a copy of the initial data
-        self._initial_data = copy.deepcopy(data)
+        # Store a copy of the initial data (data in shared memory is not copied, the
+        # processing methods never modify it in place)
+        self._initial_data = data if self._shm is not None else copy.deepcopy(data)
         self._initial_fs = fs
 
         self.dt = 1 / fs  # sampling interval
@@ -110,6 +113,67 @@ class SingleSetup(BaseSetup, GeometryMixin):
 
         self._initialize_data(data=self._initial_data, fs=self._initial_fs)
 
+    def to_shared(self) -> shared_memory.SharedMemory:
+        """
+        Copy the data into a new block of shared memory.
+
+        The data are stored in Fortran (column-major) order, the layout used by the
+        algorithms. Other processes can then build a setup on the same memory with
+        ``SingleSetup.from_shared(shm.name, data.shape, data.dtype, fs)``, without the
+        data being pickled and copied for each of them.
+
+        Returns
+        -------
+        multiprocessing.shared_memory.SharedMemory
+            The shared memory block holding the data. The caller owns it and must call
+            ``close()`` and ``unlink()`` on it when it is no longer needed.
+        """
+        shm = shared_memory.SharedMemory(create=True, size=self.data.nbytes)
+        view = np.ndarray(
+            self.data.shape, dtype=self.data.dtype, buffer=shm.buf, order="F"
+        )
+        np.copyto(view, self.data)
+        return shm
+
+    @classmethod
+    def from_shared(
+        cls,
+        name: str,
+        shape: typing.Tuple[int, int],
+        dtype: typing.Union[str, np.dtype],
+        fs: float,
+    ) -> SingleSetup:
+        """
+        Create a SingleSetup whose data are a view on an existing block of shared memory.
+
+        Parameters
+        ----------
+        name : str
+            The name of the shared memory block, as created by ``to_shared``.
+        shape : tuple of int
+            The shape (N, M) of the data.
+        dtype : str or np.dtype
+            The data type of the data.
+        fs : float
+            The sampling frequency of the data.
+
+        Returns
+        -------
+        SingleSetup
+            The new setup. It keeps the shared memory block attached for its lifetime.
+
+        Notes
+        -----
+        The data are not copied, not even as initial data for ``rollback``. The block
+        must be laid out in Fortran order, as done by ``to_shared``.
+        """
+        shm = shared_memory.SharedMemory(name=name)
+        data = np.ndarray(shape, dtype=dtype, buffer=shm.buf, order="F")
+        setup = cls.__new__(cls)
+        setup._shm = shm
+        setup.__init__(data=data, fs=fs)
+        return setup
+
     # method to plot the time histories of the data channels.
     def plot_data(
         self,
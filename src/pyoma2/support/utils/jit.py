@@ -0,0 +1,30 @@
+"""
+Optional Just-In-Time compilation with numba.
+
+If the optional package ``numba`` is installed, ``njit`` and ``prange`` are the numba
+ones; otherwise ``njit`` returns the decorated function unchanged and ``prange`` is
+the builtin ``range``, so that the decorated kernels run as plain Python/NumPy code.
+"""
+
+import typing
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args: typing.Any, **kwargs: typing.Any) -> typing.Callable:
+        """
+        No-op replacement of ``numba.njit``, usable both as ``@njit`` and as
+        ``@njit(**options)``.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func: typing.Callable) -> typing.Callable:
+            return func
+
+        return decorator
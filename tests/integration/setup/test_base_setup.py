@@ -1,5 +1,8 @@
+import unittest.mock
+
 import numpy as np
 import pytest
+from pyoma2.algorithms import FDD
 from pyoma2.setup.base import BaseSetup
 
 from tests.factory import FakeAlgorithm, FakeResult, FakeRunParams
@@ -26,6 +29,24 @@ def test_add_algorithms(base_setup):
     assert base_setup.algorithms["alg2"].fs == 100
 
 
+def test_add_algorithms_data_layout(base_setup):
+    """Test that the setup and its algorithms share the same channel-major data."""
+    alg1 = FakeAlgorithm(name="alg1")
+    alg2 = FakeAlgorithm(name="alg2")
+    initial_data = base_setup.data.copy()
+    base_setup.add_algorithms(alg1, alg2)
+    # algorithms added later share the same array
+    alg3 = FakeAlgorithm(name="alg3")
+    base_setup.add_algorithms(alg3)
+
+    data = base_setup.algorithms["alg1"].data
+    assert data is base_setup.algorithms["alg2"].data
+    assert data is base_setup.algorithms["alg3"].data
+    assert data is base_setup.data
+    assert data.T.flags["C_CONTIGUOUS"]
+    np.testing.assert_array_equal(data, initial_data)
+
+
 def test_run_all(base_setup):
     """Test the run_all method."""
     alg1 = FakeAlgorithm(name="alg1", run_params=FakeRunParams(param1=2, param2="test"))
@@ -50,6 +71,44 @@ def test_run_by_name(base_setup):
     assert isinstance(base_setup.algorithms["test_alg"].result, FakeResult)
 
 
+def test_run_all_cached(base_setup, tmp_path):
+    """Test the run_all method with a results cache directory."""
+    alg1 = FakeAlgorithm(name="alg1", run_params=FakeRunParams(param1=2, param2="test"))
+    alg2 = FakeAlgorithm(name="alg2", run_params=FakeRunParams(param1=3, param2="test"))
+    base_setup.add_algorithms(alg1, alg2)
+
+    base_setup.run_all(cache_dir=tmp_path)
+    assert len(list(tmp_path.iterdir())) == 2
+    assert isinstance(base_setup.algorithms["alg1"].result, FakeResult)
+
+    # the results are loaded from the cache, without running the algorithms again
+    alg1.result = None
+    with unittest.mock.patch.object(FakeAlgorithm, "run", side_effect=AssertionError):
+        base_setup.run_all(cache_dir=tmp_path)
+    assert isinstance(base_setup.algorithms["alg1"].result, FakeResult)
+
+    # different run parameters are a cache miss
+    alg1.run_params = FakeRunParams(param1=4, param2="test")
+    base_setup.run_by_name("alg1", cache_dir=tmp_path)
+    assert len(list(tmp_path.iterdir())) == 3
+
+    # the parameters used only by mpe are not part of the key
+    base_setup.add_algorithms(FDD(name="fdd", nxseg=64))
+    base_setup.run_by_name("fdd", cache_dir=tmp_path)
+    assert len(list(tmp_path.iterdir())) == 4
+    base_setup.mpe("fdd", sel_freq=[10.0, 20.0], DF=0.5)
+    with unittest.mock.patch.object(FDD, "run", side_effect=AssertionError):
+        base_setup.run_all(cache_dir=tmp_path)
+    assert len(list(tmp_path.iterdir())) == 4
+
+    # neither when given to the constructor
+    fdd2 = FDD(name="fdd2", nxseg=64, sel_freq=np.array([10.0, 20.0]))
+    base_setup.add_algorithms(fdd2)
+    with unittest.mock.patch.object(FDD, "run", side_effect=AssertionError):
+        base_setup.run_by_name("fdd2", cache_dir=tmp_path)
+    assert len(list(tmp_path.iterdir())) == 4
+
+
 def test_mpe(base_setup):
     """Test the mpe method."""
     alg = FakeAlgorithm(name="test_alg")
@@ -1,6 +1,7 @@
 import numpy as np
 import pytest
 from pyoma2.functions import fdd
+from scipy import signal
 
 
 @pytest.mark.parametrize(
@@ -46,6 +47,61 @@ def test_SD_est(input_method: str) -> None:
     freq, Sy = fdd.SD_est(Yall, Yref, dt, nxseg=nxseg, method=input_method, pov=pov)
     assert len(freq) > 0  # Ensure frequency array is not empty
     assert Sy.shape[0] == Yall.shape[0]  # Ensure correct shape of Sy
+    assert Sy.dtype == np.complex128
+
+    # single precision spectra
+    _, Sy64 = fdd.SD_est(
+        Yall, Yref, dt, nxseg=nxseg, method=input_method, pov=pov, dtype=np.complex64
+    )
+    assert Sy64.dtype == np.complex64
+    assert np.allclose(Sy64, Sy, rtol=1e-5, atol=1e-6 * np.abs(Sy).max())
+    S_val, S_vec = fdd.SD_svalsvec(Sy64)
+    assert S_val.dtype == np.float32
+    assert S_vec.dtype == np.complex64
+
+
+@pytest.mark.parametrize(
+    "nperseg, noverlap, window, nfft",
+    [
+        (256, 128, "hann", None),
+        (255, 0, "boxcar", 510),
+        (2000, 0, "hann", None),
+    ],
+)
+def test_SD_welch(nperseg: int, noverlap: int, window: str, nfft: int) -> None:
+    fs = 100.0
+    N = 1500
+    Yall = np.random.rand(4, N)
+    Yref = Yall[:2]
+
+    freq, Pxy = fdd.SD_welch(Yall, Yref, fs, nperseg, noverlap, window, nfft=nfft)
+    freq_sp, Pxy_sp = signal.csd(
+        Yall[:, None, :],
+        Yref[None, :, :],
+        fs=fs,
+        nperseg=nperseg,
+        noverlap=noverlap,
+        window=window,
+        nfft=nfft,
+    )
+    assert np.allclose(freq, freq_sp)
+    assert np.allclose(Pxy, Pxy_sp)
+
+
+def test_SD_svalsvec() -> None:
+    Nch = 4
+    Nf = 50
+    Sy = np.random.rand(Nch, Nch, Nf) + 1j * np.random.rand(Nch, Nch, Nf)
+
+    S_val, S_vec = fdd.SD_svalsvec(Sy)
+
+    assert S_val.shape == (Nch, Nch, Nf)
+    assert S_vec.shape == (Nch, Nch, Nf)
+    # singular values (square root) match the ones of each frequency line
+    for k in [0, Nf // 2, Nf - 1]:
+        U, S, _ = np.linalg.svd(Sy[:, :, k])
+        assert np.allclose(np.diag(S_val[:, :, k]), np.sqrt(S))
+        assert np.allclose(S_vec[:, :, k], U.conj().T)
 
 
 def test_FDD_mpe():
@@ -67,6 +123,17 @@ def test_FDD_mpe():
     assert isinstance(Fn, np.ndarray)
     assert isinstance(Phi, np.ndarray)
 
+    # Check that the peaks of the singular values ratio are found
+    Sval = np.ones((2, 2, 1000))
+    Sval[0, 0, [240, 505, 751]] = 10.0
+    Fn, Phi = fdd.FDD_mpe(Sval, Svec, freq, sel_freq, DF=1.0)
+    assert np.allclose(Fn, freq[[240, 505, 751]])
+    assert np.allclose(np.max(np.abs(Phi), axis=0), 1.0)
+
+    # No frequency lines within the bandwidth
+    with pytest.raises(ValueError):
+        fdd.FDD_mpe(Sval, Svec, freq, sel_freq, DF=0.01)
+
 
 @pytest.mark.parametrize(
     "input_method",
@@ -104,6 +171,14 @@ def test_SDOF_bellandMS(input_method: str) -> None:
     assert isinstance(SDOFbell1, np.ndarray)
     assert isinstance(SDOFms1, np.ndarray)
 
+    # Check that precomputed singular values and vectors give the same result
+    Sval, Svec = fdd.SD_svalsvec(Sy)
+    SDOFbell2, SDOFms2 = fdd.SDOF_bellandMS(
+        Sy, dt, sel_fn, phi_FDD, input_method, cm, MAClim, DF, Sval=Sval, Svec=Svec
+    )
+    assert np.allclose(SDOFbell1, SDOFbell2)
+    assert np.allclose(SDOFms1, SDOFms2)
+
 
 @pytest.mark.parametrize(
     "input_method",
@@ -129,3 +204,29 @@ def test_EFDD_mpe(input_method: str) -> None:
     assert Xi.shape[0] == len(sel_freq)
     assert Phi.shape == (Sy.shape[0], len(sel_freq))
     assert all([len(per_plot) == 9 for per_plot in PerPlot])
+
+    # not enough peaks in the autocorrelation for the fit
+    with pytest.raises(IndexError, match="peaks found in the autocorrelation"):
+        fdd.EFDD_mpe(
+            Sy=Sy, freq=freq, dt=dt, sel_freq=sel_freq, methodSy=input_method, npmax=1000
+        )
+
+
+def test_EFDD_minmax() -> None:
+    """Test the peak picking between every second zero crossing."""
+    # zero crossings after the indices 1, 4, 7, 10, 13 -> two (min, max) couples
+    normSDOFcorr = np.array(
+        [0.8, 0.5, -0.5, -1.0, -0.5, 0.5, 0.8, 0.5, -0.5, -0.6, -0.3, 0.2, 0.4, 0.1, -0.2]
+    )
+    minmax, minmax_idx = fdd.EFDD_minmax(normSDOFcorr)
+
+    assert np.allclose(minmax, [-1.0, 0.8, -0.6, 0.5])
+    # the peaks are searched within their own half-cycles: the value 0.8 at index 0,
+    # before the first crossing, must not be picked
+    assert np.array_equal(minmax_idx, [3, 6, 9, 7])
+    assert np.allclose(normSDOFcorr[minmax_idx], minmax)
+
+    # a single zero crossing: no (min, max) couple
+    minmax, minmax_idx = fdd.EFDD_minmax(np.array([1.0, 0.5, -0.5, -1.0]))
+    assert minmax.shape == (0,)
+    assert minmax_idx.shape == (0,)
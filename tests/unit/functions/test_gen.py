@@ -62,6 +62,16 @@ def test_MAC() -> None:
     phi_A = np.array([2 + 3j, 3 + 4j, 4 + 5j])
     assert gen.MAC(phi_X, phi_A) == pytest.approx(0.9929349425964087 + 0j)
 
+    # matrix of MAC values between two sets of mode shapes
+    Phi_X = np.random.rand(5, 3) + 1j * np.random.rand(5, 3)
+    Phi_A = np.random.rand(5, 4) + 1j * np.random.rand(5, 4)
+    mac = gen.MAC(Phi_X, Phi_A)
+    assert mac.shape == (3, 4)
+    for i in range(3):
+        for j in range(4):
+            assert mac[i, j] == pytest.approx(gen.MAC(Phi_X[:, i], Phi_A[:, j]))
+    assert np.allclose(np.diag(gen.MAC(Phi_X, Phi_X)), 1.0)
+
 
 @pytest.mark.parametrize(
     "input_phi_X, expected_exc_msg",
@@ -117,3 +127,49 @@ def test_filter_data(fs, Wn, order, btype, expected_shape) -> None:
     data = np.random.rand(100, 2)
     filt_data = gen.filter_data(data, fs, Wn, order, btype)
     assert filt_data.shape == expected_shape
+
+
+def test_SC_apply() -> None:
+    ordmax = 10
+    Fn = np.full((ordmax, ordmax + 1), np.nan)
+    Xi = np.full((ordmax, ordmax + 1), np.nan)
+    Phi = np.full((ordmax, ordmax + 1, 3), np.nan, dtype=complex)
+    # one pole, stable from order 3 on
+    Fn[0, 2:] = 5.0
+    Xi[0, 2:] = 0.02
+    Phi[0, 2:] = np.array([1.0, 0.5 + 0.1j, -0.3])
+    # spurious pole changing at each order
+    Fn[1, 2:] = np.linspace(10, 20, ordmax - 1)
+    Xi[1, 2:] = 0.05
+    Phi[1, 2:] = np.array([1.0, -1.0, 0.2])
+
+    Lab = gen.SC_apply(Fn, Xi, Phi, 0, ordmax, 1, 0.01, 0.05, 0.02)
+
+    assert Lab.shape == Fn.shape
+    assert np.all(Lab[0, 3:] == 1)
+    assert np.all(Lab[0, :3] == 0)
+    assert np.all(Lab[1:] == 0)
+
+
+def test_read_excel_file(tmp_path, monkeypatch) -> None:
+    import pandas as pd
+
+    path = tmp_path / "geo.xlsx"
+    pd.DataFrame({"x": [1.0, 2.0]}, index=["a", "b"]).to_excel(path, sheet_name="s1")
+
+    file_dict = gen.read_excel_file(path=str(path))
+    assert list(file_dict) == ["s1"]
+    # a copy of the cached contents is returned
+    file_dict["s1"].loc["a", "x"] = 10.0
+    assert gen.read_excel_file(path=str(path))["s1"].loc["a", "x"] == 1.0
+
+    # modified files are read again
+    pd.DataFrame({"x": [3.0]}, index=["c"]).to_excel(path, sheet_name="s2")
+    assert list(gen.read_excel_file(path=str(path))) == ["s2"]
+
+    # paths relative to the home directory are expanded, as by pd.read_excel
+    monkeypatch.setenv("HOME", str(tmp_path))
+    assert list(gen.read_excel_file(path="~/geo.xlsx")) == ["s2"]
+
+    with pytest.raises(RuntimeError):
+        gen.read_excel_file(path=str(tmp_path / "missing.xlsx"))
@@ -177,6 +177,59 @@ def test_SSI() -> None:
     assert all([isinstance(c, np.ndarray) for c in C])
 
 
+def test_SVD_trunc() -> None:
+    """Test the SVD_trunc function against the full SVD."""
+    H = np.random.rand(60, 40)
+    ordmax = 10
+
+    U, S, V_t = ssi.SVD_trunc(H, ordmax)
+    U1, S1, V1_t = np.linalg.svd(H)
+
+    assert U.shape == (60, ordmax)
+    assert S.shape == (ordmax,)
+    assert V_t.shape == (ordmax, 40)
+    assert np.allclose(S, S1[:ordmax])
+    # singular vectors are defined up to their sign
+    assert np.allclose(np.abs(U), np.abs(U1[:, :ordmax]))
+    assert np.allclose(np.abs(V_t), np.abs(V1_t[:ordmax, :]))
+    assert np.allclose(
+        np.dot(U * S, V_t), np.dot(U1[:, :ordmax] * S1[:ordmax], V1_t[:ordmax])
+    )
+
+
+@pytest.mark.parametrize("ordmax", [30, 50, 52, 90])
+def test_SVD_trunc_ill_conditioned(ordmax: int) -> None:
+    """Test SVD_trunc on a fast decaying spectrum, on both sides of SVD_TRUNC_RTOL."""
+    rng = np.random.default_rng(0)
+    # singular values from 1 to 2e-8, ordmax = 50 is the last one above SVD_TRUNC_RTOL
+    S0 = np.logspace(0, -7.7, 100)
+    U0, _ = np.linalg.qr(rng.standard_normal((120, 100)))
+    V0, _ = np.linalg.qr(rng.standard_normal((100, 100)))
+    H = np.dot(U0 * S0, V0.T)
+
+    U, S, V_t = ssi.SVD_trunc(H, ordmax)
+
+    assert np.allclose(S, S0[:ordmax], rtol=1e-7, atol=0)
+    # singular vectors are defined up to their sign
+    assert np.allclose(np.abs(np.sum(U * U0[:, :ordmax], axis=0)), 1, atol=1e-7)
+    assert np.allclose(np.abs(np.sum(V_t * V0[:, :ordmax].T, axis=1)), 1, atol=1e-7)
+    assert np.allclose(np.linalg.norm(V_t, axis=1), 1, atol=1e-7)
+
+
+@pytest.mark.parametrize("full_matrices", [False, True])
+def test_svd(full_matrices: bool) -> None:
+    """Test the gesdd SVD against numpy, reusing the workspace size on repeated calls."""
+    for _ in range(2):
+        H = np.random.rand(60, 40)
+        U, S, V_t = ssi._svd(H, full_matrices=full_matrices)
+        U1, S1, V1_t = np.linalg.svd(H, full_matrices=full_matrices)
+
+        assert np.allclose(U, U1)
+        assert np.allclose(S, S1)
+        assert np.allclose(V_t, V1_t)
+    assert ("d", 60, 40, full_matrices) in ssi._GESDD_LWORK
+
+
 def test_SSI_fast() -> None:
     """Test the SSI_fast function."""
     H = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9], [10, 11, 12]])
@@ -1,7 +1,10 @@
+import hashlib
 from typing import Any
 
+import numpy as np
 import pytest
 from pyoma2.algorithms import BaseAlgorithm
+from pyoma2.algorithms.base import _hash_update
 from pyoma2.algorithms.data.run_params import BaseRunParams
 from pyoma2.setup import SingleSetup
 
@@ -134,3 +137,89 @@ def test_result_from_setup(fake_single_setup_fixture_with_param: SingleSetup):
             for algo in fake_single_setup_fixture_with_param.algorithms.values()
         ]
     )
+
+
+def test_copy_algorithm():
+    """
+    Check that a copied algorithm has its own run parameters, equal to the original ones
+    """
+    import copy
+
+    from pyoma2.algorithms import SSIcov
+
+    base = SSIcov(name="SSIcov", method="cov_mm", br=50, ordmax=80)
+    algo = copy.copy(base)
+    algo.name = "SSIcov1"
+
+    assert isinstance(algo, SSIcov)
+    assert base.name == "SSIcov"
+    assert algo.run_params is not base.run_params
+    assert algo.run_params == base.run_params
+
+    algo.run_params.rtol = 0.5
+    assert base.run_params.rtol != 0.5
+
+
+def test_class_getitem_returns_same_class():
+    """
+    Check that subscribing an algorithm class returns the class itself, unchanged
+    """
+    from pyoma2.algorithms import EFDD, FDD
+    from pyoma2.algorithms.data.result import EFDDResult, FDDResult
+    from pyoma2.algorithms.data.run_params import EFDDRunParams, FDDRunParams
+
+    assert FDD[EFDDRunParams, EFDDResult, Any] is FDD
+    assert FDD.RunParamCls is FDDRunParams
+    assert FDD.ResultCls is FDDResult
+    assert issubclass(EFDD, FDD)
+
+
+def test_dataclass_run_param_cls():
+    """
+    Check that RunParamCls can be a dataclass, used without pydantic validation
+    """
+    import copy
+    import dataclasses
+
+    from pyoma2.algorithms.data.result import BaseResult
+
+    @dataclasses.dataclass
+    class MyRunParams:
+        param1: int = 1
+
+    class MyAlgo(BaseAlgorithm):
+        RunParamCls = MyRunParams
+        ResultCls = BaseResult
+
+        def run(self):
+            return BaseResult()
+
+        def mpe(self, *args, **kwargs) -> Any:
+            return super().mpe(*args, **kwargs)
+
+        def mpe_from_plot(self, *args, **kwargs) -> Any:
+            return super().mpe_from_plot(*args, **kwargs)
+
+    algo = MyAlgo(param1=2)
+    assert algo.run_params == MyRunParams(param1=2)
+
+    algo_copy = copy.copy(algo)
+    assert algo_copy.run_params == algo.run_params
+    assert algo_copy.run_params is not algo.run_params
+
+
+def test_hash_update_memory_order():
+    """
+    Check that arrays sharing shape and buffer, but not the values, hash differently
+    """
+    data_c = np.array([[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]])
+    # same shape and same bytes in memory, in Fortran order
+    data_f = np.ndarray((2, 3), buffer=data_c.tobytes(), order="F")
+    assert not np.array_equal(data_c, data_f)
+
+    digests = []
+    for data in (data_c, data_f):
+        h = hashlib.sha256()
+        _hash_update(h, [{"ref": data, "mov": data}])
+        digests.append(h.hexdigest())
+    assert digests[0] != digests[1]
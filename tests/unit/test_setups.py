@@ -18,6 +18,31 @@ def test_init_single_setup(ss: SingleSetup) -> None:
     assert ss.algorithms == {}
 
 
+def test_single_setup_shared_memory() -> None:
+    """Test that SingleSetup.from_shared works on the shared data without copying it."""
+    data = np.random.rand(1000, 4)
+    shm = SingleSetup(data, fs=100).to_shared()
+    try:
+        ss = SingleSetup.from_shared(shm.name, data.shape, data.dtype, fs=100)
+        assert np.array_equal(ss.data, data)
+        assert ss.Nch == 4 and ss.Ndat == 1000
+        assert ss._initial_data is ss.data
+
+        # the algorithms use the shared buffer as it is
+        ss.add_algorithms(FakeAlgorithm(name="one"))
+        assert np.shares_memory(ss["one"].data, ss.data)
+
+        # processing and rollback leave the shared data untouched
+        ss.decimate_data(q=2)
+        assert ss.Ndat == 500
+        ss.rollback()
+        assert np.array_equal(ss.data, data)
+        del ss
+    finally:
+        shm.close()
+        shm.unlink()
+
+
 @pytest.mark.parametrize(
     "init_kwargs, algorithms, names, run_first, expected_exception, expected_message",
     [
@@ -275,3 +300,20 @@ def test_init_multisetup_preger(multi_setup_data_fixture) -> None:
     assert all(([k for k in d] == ["ref", "mov"] for d in msp.data))
     assert all(([isinstance(v, np.ndarray) for v in d.values()] for d in msp.data))
     assert msp.Ts == [600.0, 600.0, 600.0]
+
+
+@pytest.mark.parametrize("ndats", [(2000, 2000, 2000), (2000, 1800, 2000)])
+def test_multisetup_preger_decimate_data(ndats: typing.Tuple[int, int, int]) -> None:
+    """Test that MultiSetup_PreGER decimates every dataset as a single setup would."""
+    data = [np.random.rand(ndat, 5) for ndat in ndats]
+    ref_ind = [[0, 1], [0, 1], [0, 1]]
+    msp = MultiSetup_PreGER(fs=100, ref_ind=ref_ind, datasets=data)
+
+    msp.decimate_data(q=4)
+
+    assert msp.fs == 25.0
+    for dataset, newdata, Ndat in zip(data, msp.datasets, msp.Ndats):
+        ss = SingleSetup(dataset, fs=100)
+        ss.decimate_data(q=4)
+        assert np.allclose(newdata, ss.data)
+        assert Ndat == ss.Ndat